@@ -23,9 +23,7 @@ logger = logging.getLogger("agent")
 load_dotenv(".env.local")
 
 
-class GameMaster(Agent):
-    def __init__(self) -> None:
-        instructions = """
+GAME_MASTER_INSTRUCTIONS = """
 You are a Dungeons & Dragons–style Game Master running a voice-only fantasy adventure
 in a world called FALCON REALMS.
 
@@ -93,7 +91,11 @@ ALWAYS:
 - Keep things clear and vivid, but not overly long.
 - ALWAYS end with a question for the player: "What do you do next?"
 """
-        super().__init__(instructions=instructions)
+
+
+class GameMaster(Agent):
+    def __init__(self) -> None:
+        super().__init__(instructions=GAME_MASTER_INSTRUCTIONS)
 
 
 # ----------------------- Session Setup -----------------------
@@ -129,7 +131,7 @@ async def entrypoint(ctx: JobContext):
 
     async def log_usage():
         summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
+        logger.info("Usage: %s", summary)
 
     ctx.add_shutdown_callback(log_usage)
 